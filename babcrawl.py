@@ -1,65 +1,262 @@
-import tkinter as tk
-from tkinter import filedialog
 import csv
-import re
 
-def extract_vocabulary_pairs(text):
+try:
+    # Das externe regex-Modul ist ein Drop-in-Ersatz für re mit deutlich
+    # schnellerer Ausführung oft benutzter Muster; die Kompilierung ist
+    # teurer, fällt hier aber nur einmal beim Import an
+    import regex as re
+except ImportError:
+    import re
+
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+# Navigationszeilen aus dem Babbel-Export, die keine Vokabeln sind
+# (exakter Vergleich, da z.B. "Mittel" auch in echten Vokabeln vorkommen
+# kann); interniert, damit der Set-Vergleich meist ein Zeigervergleich ist
+_SKIP_LINES = frozenset(map(sys.intern, (
+    'Home', 'Üben', 'Entdecken', 'Alle Vokabeln', 'Auswählen',
+    'Alle', 'Schwach', 'Mittel', 'Stark',
+)))
+
+# Markierungen, zwischen denen die Vokabelliste im Export steht
+_START_MARKER = "Speichere Wörter und Sätze, damit du sie jederzeit wiederholen kannst."
+_END_MARKER = "Vokabeln pro Seite"
+
+# Zeichen, die beim CSV-Schreiben Quoting erzwingen würden
+_CSV_SPECIAL_RE = re.compile('[;"\r\n]')
+
+# Fußzeilen-/Navigationsbegriffe in einem einzigen Muster zusammengefasst:
+# ein C-Level-Scan pro Zeile statt mehrerer einzelner Substring-Suchen
+_NAV_RE = re.compile('|'.join(map(re.escape, (
+    'Lernen mit', 'Babbel', 'Karriere', 'Imprint', 'AGB',
+))))
+
+# Einmal kompilierte Muster und Zeichenmengen statt vieler
+# Python-Einzelprüfungen pro Zeile
+_GERMAN_PREFIX_RE = re.compile(r'^(?:[Dd]er|[Dd]ie|[Dd]as|[Dd]e[nm]|[Ee]ine?[nm]?) ')
+_PORTUGUESE_PREFIX_RE = re.compile(r'^(?:[ao]s?|uma?) ')
+# Zeichenklassen als kompilierte Muster: ein C-Scan über die Zeile statt
+# eines Mengen-Vergleichs, der jedes Zeichen einzeln hashen muss
+_DE_CHAR_RE = re.compile('[äöüß]')
+_PT_CHAR_RE = re.compile('[ãõçáéíóú]')
+
+# Billige Vorprüfung per Slice fester Länge + frozenset, bevor die Regex
+# überhaupt anläuft: ein Hash-Lookup statt zwölf Präfix-Vergleichen, und
+# die allermeisten Zeilen scheitern schon hier ('ein' deckt auch
+# eine/einen/einem ab, die Regex bestätigt die Wortgrenze)
+_GERMAN_PREFIXES_3 = frozenset((
+    'der', 'die', 'das', 'den', 'dem', 'ein',
+    'Der', 'Die', 'Das', 'Den', 'Dem', 'Ein',
+))
+_PORTUGUESE_PREFIXES_2 = frozenset(('a ', 'o ', 'as', 'os', 'um'))
+
+# Verstecktes Tkinter-Hauptfenster, einmal erzeugt und dann für alle
+# Dialoge wiederverwendet
+_tk_root = None
+
+def _get_tk_root():
     """
-    Extrahiert Vokabelpaare aus dem Text zwischen den Markierungen.
+    Liefert das versteckte Tkinter-Hauptfenster (lazy erzeugt).
     """
-    # Finde den Bereich zwischen den beiden Markierungen
-    start_marker = "Speichere Wörter und Sätze, damit du sie jederzeit wiederholen kannst."
-    end_marker = "Vokabeln pro Seite"
-    
-    start_idx = text.find(start_marker)
-    end_idx = text.find(end_marker)
-    
-    if start_idx == -1 or end_idx == -1:
-        print("Warnung: Marker nicht gefunden!")
-        return []
-    
-    # Extrahiere den relevanten Teil
-    vocab_section = text[start_idx + len(start_marker):end_idx].strip()
-    
-    # Teile in Zeilen auf
-    lines = vocab_section.split('\n')
-    
-    vocab_pairs = []
-    i = 0
-    
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        # Überspringe leere Zeilen
+    global _tk_root
+
+    if _tk_root is None:
+        # tkinter erst im GUI-Pfad importieren: reine CLI-Aufrufe (und
+        # die Worker-Prozesse) sparen sich den teuren Import beim Start
+        import tkinter as tk
+
+        _tk_root = tk.Tk()
+        _tk_root.withdraw()
+        _tk_root.attributes('-topmost', True)
+
+    return _tk_root
+
+def _is_skip_line(line):
+    """
+    Navigations- oder Fußzeilenrest aus dem Babbel-Export?
+    """
+    # Nur kurze Kandidaten internieren, um die Intern-Tabelle nicht mit
+    # beliebigen Vokabelzeilen zu füllen
+    if len(line) < 20 and sys.intern(line) in _SKIP_LINES:
+        return True
+    return _NAV_RE.search(line) is not None
+
+def _looks_german(line):
+    """
+    Grobe Heuristik: deutscher Artikel am Zeilenanfang oder Umlaute/ß.
+    """
+    if line[:3] in _GERMAN_PREFIXES_3 and _GERMAN_PREFIX_RE.match(line):
+        return True
+    # isascii() liest nur ein beim Erzeugen des Strings gesetztes Flag –
+    # rein-ASCII-Zeilen kommen so ganz ohne Zeichenklassen-Scan aus
+    return not line.isascii() and _DE_CHAR_RE.search(line) is not None
+
+def _looks_portuguese(line):
+    """
+    Grobe Heuristik: portugiesischer Artikel am Zeilenanfang oder Akzentzeichen.
+    """
+    if line[:2] in _PORTUGUESE_PREFIXES_2 and _PORTUGUESE_PREFIX_RE.match(line):
+        return True
+    return not line.isascii() and _PT_CHAR_RE.search(line) is not None
+
+def extract_vocabulary_pairs(line_iter):
+    """
+    Extrahiert Vokabelpaare aus einem Zeilen-Iterator (z.B. einer offenen
+    Datei) zwischen den Markierungen – in einem einzigen Durchlauf, ohne
+    die Datei komplett in den Speicher zu laden.
+    """
+    in_section = False
+    pending = None  # wartende portugiesische Zeile ohne Übersetzung
+    seen = set()    # Duplikate innerhalb einer Datei (erneutes Scrollen
+                    # im Export) verlassen die Funktion gar nicht erst
+
+    # Häufig benutzte Namen vor der Schleife lokal binden: LOAD_FAST
+    # statt eines Modul-Lookups pro Iteration
+    is_skip_line = _is_skip_line
+    looks_german = _looks_german
+    looks_portuguese = _looks_portuguese
+    seen_add = seen.add
+
+    for raw_line in line_iter:
+        line = raw_line.strip()
+
+        # Vorspann bis zur Start-Markierung überspringen
+        if not in_section:
+            if _START_MARKER in line:
+                in_section = True
+            continue
+
+        # End-Markierung: dahinter kommt nur noch Fußzeile
+        if _END_MARKER in line:
+            break
+
+        # Eine Leerzeile schließt den Block ab – eine einzelne Zeile ohne
+        # Übersetzung wird verworfen statt alle folgenden Paare zu verschieben
         if not line:
-            i += 1
+            pending = None
             continue
-        
-        # Portugiesische Zeile (kann mehrere Wörter haben)
-        portuguese = line
-        
-        # Nächste Zeile sollte die deutsche Übersetzung sein
-        if i + 1 < len(lines):
-            german = lines[i + 1].strip()
-            
-            # Füge das Paar hinzu, wenn beide vorhanden sind
-            if portuguese and german:
-                vocab_pairs.append((portuguese, german))
-            
-            i += 2  # Springe zum nächsten Paar
-        else:
-            i += 1
-    
-    return vocab_pairs
+
+        if pending is None:
+            pending = line
+            continue
+
+        # Portugiesische Zeile, darunter die deutsche Übersetzung
+        portuguese, german = pending, line
+        pending = None
+
+        # Navigations- und Fußzeilenreste nicht als Vokabeln übernehmen
+        if is_skip_line(portuguese) or is_skip_line(german):
+            continue
+
+        # Vertauschte Reihenfolge erkennen und korrigieren
+        if looks_german(portuguese) and looks_portuguese(german):
+            portuguese, german = german, portuguese
+
+        pair = (portuguese, german)
+        if pair in seen:
+            continue
+        seen_add(pair)
+
+        yield pair
+
+    if not in_section:
+        print("Warnung: Marker nicht gefunden!")
+
+def _read_and_extract(file_path):
+    """
+    Worker für die parallele Verarbeitung: eine Datei lesen und extrahieren.
+    """
+    try:
+        # Zeilenweise streamen statt Volltext + Zeilenliste aufzubauen:
+        # der Spitzen-Speicherbedarf bleibt bei wenigen Zeilen, und jede
+        # Zeile wird genau einmal angefasst
+        with open(file_path, encoding='utf-8', errors='replace',
+                  buffering=131072) as f:
+            return list(extract_vocabulary_pairs(f))
+    except Exception as e:
+        print(f"Fehler beim Verarbeiten von {file_path}: {e}")
+        return []
+
+def process_files(file_paths):
+    """
+    Liest alle Dateien ein und liefert die Vokabelpaare
+    dedupliziert und alphabetisch sortiert zurück.
+    """
+    # Duplikate direkt beim Einsammeln über ein dict verwerfen, statt erst
+    # die komplette Liste aufzubauen und am Ende ein set() darüberzulegen –
+    # so liegt jedes Paar nur einmal im Speicher
+    unique = {}
+    total = 0
+
+    # Jede Datei ist unabhängig voneinander auswertbar – die Extraktion
+    # läuft daher parallel auf allen Kernen, am GIL vorbei
+    with ProcessPoolExecutor() as pool:
+        for file_path, pairs in zip(file_paths,
+                                    pool.map(_read_and_extract, file_paths)):
+            print(f"Verarbeite: {file_path}")
+            print(f"  → {len(pairs)} Vokabelpaare gefunden")
+            total += len(pairs)
+            for pair in pairs:
+                unique[pair] = None
+
+    # Sortierung über einen einmal vorberechneten casefold-Schlüssel,
+    # statt .lower() bei jedem Vergleich neu auszuwerten
+    unique_vocab_pairs = [
+        pair for _, pair in sorted(
+            ((pair[0].casefold(), pair) for pair in unique),
+            key=itemgetter(0),
+        )
+    ]
+
+    duplicates = total - len(unique_vocab_pairs)
+    if duplicates:
+        print(f"  → {duplicates} Duplikate entfernt")
+
+    return unique_vocab_pairs
+
+def save_to_csv(vocab_pairs, csv_path):
+    """
+    Schreibt die Vokabelpaare als Semikolon-getrennte CSV-Datei.
+    """
+    # Vokabeln enthalten praktisch nie Semikolons oder Anführungszeichen –
+    # dann reicht ein einfaches join statt der generischen Quoting-Prüfung
+    # des csv-Moduls pro Feld
+    needs_quoting = any(
+        _CSV_SPECIAL_RE.search(pt) or _CSV_SPECIAL_RE.search(de)
+        for pt, de in vocab_pairs
+    )
+
+    try:
+        # Großer Schreibpuffer: die ganze CSV geht in ein bis zwei
+        # write-Syscalls raus statt in viele kleine
+        with open(csv_path, 'w', encoding='utf-8', newline='',
+                  buffering=262144) as csvfile:
+            # Schreibe Header
+            # csvfile.write('Portugiesisch;Deutsch\n')
+
+            # Schreibe Vokabelpaare
+            if needs_quoting:
+                writer = csv.writer(csvfile, delimiter=';', lineterminator='\n')
+                writer.writerows(vocab_pairs)
+            else:
+                csvfile.write('\n'.join(f'{pt};{de}' for pt, de in vocab_pairs))
+                csvfile.write('\n')
+
+        print(f"\n✓ CSV erfolgreich erstellt: {csv_path}")
+        print(f"✓ Insgesamt {len(vocab_pairs)} Vokabelpaare exportiert")
+
+    except Exception as e:
+        print(f"Fehler beim Schreiben der CSV: {e}")
 
 def convert_txt_to_csv():
     """
-    Hauptfunktion: Öffnet Dateidialog, verarbeitet Dateien und erstellt CSV.
+    GUI-Modus: Öffnet Dateidialoge, verarbeitet Dateien und erstellt CSV.
     """
-    # Erstelle ein verstecktes Tkinter-Fenster
-    root = tk.Tk()
-    root.withdraw()
-    
+    _get_tk_root()
+    from tkinter import filedialog
+
     # Öffne Dateidialog zur Auswahl mehrerer TXT-Dateien
     file_paths = filedialog.askopenfilenames(
         title="Wähle Babbel Vokabel-Dateien aus",
@@ -70,21 +267,9 @@ def convert_txt_to_csv():
         print("Keine Dateien ausgewählt.")
         return
     
-    # Sammle alle Vokabelpaare
-    all_vocab_pairs = []
-    
-    for file_path in file_paths:
-        print(f"Verarbeite: {file_path}")
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
-                pairs = extract_vocabulary_pairs(text)
-                all_vocab_pairs.extend(pairs)
-                print(f"  → {len(pairs)} Vokabelpaare gefunden")
-        except Exception as e:
-            print(f"Fehler beim Verarbeiten von {file_path}: {e}")
-    
+    # Sammle alle Vokabelpaare (dedupliziert und sortiert)
+    all_vocab_pairs = process_files(file_paths)
+
     if not all_vocab_pairs:
         print("Keine Vokabelpaare gefunden!")
         return
@@ -99,26 +284,45 @@ def convert_txt_to_csv():
     if not csv_path:
         print("Kein Speicherort ausgewählt.")
         return
-    
-    # Schreibe CSV-Datei
-    try:
-        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.writer(f, delimiter=';')
-            
-            # Schreibe Header
-            # writer.writerow(['Portugiesisch', 'Deutsch'])
-            
-            # Schreibe Vokabelpaare
-            writer.writerows(all_vocab_pairs)
-        
-        print(f"\n✓ CSV erfolgreich erstellt: {csv_path}")
-        print(f"✓ Insgesamt {len(all_vocab_pairs)} Vokabelpaare exportiert")
-        
-    except Exception as e:
-        print(f"Fehler beim Schreiben der CSV: {e}")
 
-if __name__ == "__main__":
+    save_to_csv(all_vocab_pairs, csv_path)
+
+def main():
+    # argparse wird nur im Hauptprozess gebraucht, nicht in den Workern
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Konvertiert Babbel Vokabel-Exporte (TXT) in eine CSV-Datei.'
+    )
+    parser.add_argument(
+        '--input_files', nargs='+', metavar='TXT',
+        help='zu verarbeitende TXT-Dateien (ohne Angabe öffnet sich ein Dateidialog)'
+    )
+    parser.add_argument(
+        '-o', '--output', metavar='CSV', default='vokabelliste_babbel.csv',
+        help='Pfad der Ausgabe-CSV (Standard: %(default)s)'
+    )
+    parser.add_argument(
+        '-g', '--gui', action='store_true',
+        help='Dateiauswahl per Dialog erzwingen'
+    )
+    args = parser.parse_args()
+
     print("Babbel Vokabel-Konverter")
     print("=" * 50)
-    convert_txt_to_csv()
-    print("\nFertig!")
\ No newline at end of file
+
+    if args.gui or not args.input_files:
+        convert_txt_to_csv()
+    else:
+        vocab_pairs = process_files(args.input_files)
+
+        if not vocab_pairs:
+            print("Keine Vokabelpaare gefunden!")
+            return
+
+        save_to_csv(vocab_pairs, args.output)
+
+    print("\nFertig!")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file